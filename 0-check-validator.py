@@ -0,0 +1,120 @@
+"""
+Validator cross-check: NumPy path vs pure-Python path
+
+Purpose:
+    SortValidator.feed_many uses NumPy for large chunks when it is installed
+    and a pure-Python loop otherwise. Both must give the same digest hash,
+    count, is_sorted and first_violation. This script feeds identical data
+    through SortValidator._feed_numpy and SortValidator._feed_python and
+    reports any mismatch.
+
+Cases:
+    - random data (sorted and unsorted)
+    - negative values
+    - values at the int64 edges
+    - a descent that crosses a chunk boundary
+    - values outside int64 (NumPy path must decline; Python path handles them)
+    - MultisetDigest.add_many (bulk input-side digest) vs per-value add
+
+Usage:
+    python check_validator.py
+    Exits with status 1 on any mismatch, 2 if NumPy is not installed.
+"""
+
+import sys
+
+from io_utils import MultisetDigest, SortValidator, np
+from rng import LCG
+
+INT64_MIN = -(2 ** 63)
+INT64_MAX = 2 ** 63 - 1
+
+
+def _state(sv: SortValidator):
+    return (sv.digest.count, sv.digest.hash, sv.is_sorted, sv.first_violation)
+
+
+def _compare(name: str, chunks) -> bool:
+    """Feed the same chunks through both paths; print and return whether they agree."""
+    sv_np = SortValidator()
+    sv_py = SortValidator()
+    for chunk in chunks:
+        if not sv_np._feed_numpy(chunk):
+            print(f"FAIL {name}: NumPy path declined an int64 chunk")
+            return False
+        sv_py._feed_python(chunk)
+    if _state(sv_np) != _state(sv_py):
+        print(f"FAIL {name}: numpy={_state(sv_np)} python={_state(sv_py)}")
+        return False
+    print(f"ok   {name}: count={sv_py.digest.count} sorted={sv_py.is_sorted} "
+          f"first_violation={sv_py.first_violation}")
+    return True
+
+
+def _random_values(rng: LCG, n: int, lo: int, hi: int) -> list[int]:
+    return [rng.randint(lo, hi) for _ in range(n)]
+
+
+def main() -> int:
+    if np is None:
+        print("NumPy not installed; nothing to cross-check.")
+        return 2
+    rng = LCG(seed=20261019)
+    results = []
+
+    rnd = _random_values(rng, 10000, 0, 1000000)
+    results.append(_compare("random unsorted", [rnd]))
+    results.append(_compare("random sorted", [sorted(rnd)]))
+
+    neg = sorted(_random_values(rng, 5000, -1000000, 1000000))
+    results.append(_compare("negatives sorted", [neg]))
+    neg_bad = neg[:]
+    neg_bad[1234], neg_bad[1235] = neg_bad[1235], neg_bad[1234] + 1
+    results.append(_compare("negatives with descent", [neg_bad]))
+
+    edges = [INT64_MIN, INT64_MIN + 1, -1, 0, 1, INT64_MAX - 1, INT64_MAX]
+    results.append(_compare("int64 edges sorted", [edges]))
+    results.append(_compare("int64 edges reversed", [edges[::-1]]))
+
+    # Each chunk is sorted on its own; the descent is only between chunks.
+    a = list(range(0, 5000))
+    b = list(range(4000, 9000))
+    results.append(_compare("descent across chunk boundary", [a, b]))
+    results.append(_compare("ascending across chunks", [a, list(range(5000, 9000))]))
+
+    # Descent inside the second chunk, after a clean boundary.
+    c = list(range(5000, 9000))
+    c[100] = 0
+    results.append(_compare("descent inside later chunk", [a, c]))
+
+    # Out-of-int64 values must make the NumPy path decline, not wrap.
+    sv = SortValidator()
+    declined = not sv._feed_numpy([0, INT64_MAX + 1])
+    print(("ok  " if declined else "FAIL") + " NumPy path declines values beyond int64")
+    results.append(declined)
+
+    # Public feed_many on a large list must match the Python reference too.
+    sv_pub = SortValidator()
+    sv_pub.feed_many(rnd)
+    sv_ref = SortValidator()
+    sv_ref._feed_python(rnd)
+    same = _state(sv_pub) == _state(sv_ref)
+    print(("ok  " if same else "FAIL") + " feed_many dispatch matches Python reference")
+    results.append(same)
+
+    # Bulk input-side digest (NumPy for large batches) vs per-value add.
+    for name, data in (("random", rnd), ("negatives", neg), ("int64 edges x1000", edges * 1000)):
+        bulk = MultisetDigest()
+        bulk.add_many(data)
+        ref = MultisetDigest()
+        for v in data:
+            ref.add(v)
+        same = bulk.same_as(ref)
+        print(("ok  " if same else "FAIL") + f" MultisetDigest.add_many matches add ({name})")
+        results.append(same)
+
+    return 0 if all(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,6 +9,9 @@ Purpose:
       2) Execute all five sorting algorithms on all datasets, capturing
          counts of comparisons and exchanges, and writing the outputs
          to labeled text files.
+      3) Profile scaling: run all five sorts over a geometric size sweep,
+         recording time, peak memory and counters, and fit the empirical
+         complexity exponent per algorithm and input order.
 
 Usage:
     Generate inputs:
@@ -17,6 +20,10 @@ Usage:
     Run all sorts on all inputs:
         python drivers.py run <input_dir> <output_dir>
 
+    Scaling sweep (inputs built in memory; max_n defaults to 10^7,
+    time_limit_s and trace_limit_s to 60):
+        python drivers.py scale <output_dir> [max_n] [time_limit_s] [trace_limit_s]
+
 Notes:
     - This file is the only program entry point for the lab.
     - All file names are provided via the command line (no GUI/interactive).
@@ -37,6 +44,7 @@ Dependencies:
     - insertion.py
     - natural_merge.py
     - io_utils.py
+    - profiling.py
 """
 
 import sys
@@ -45,22 +53,28 @@ from typing import Optional
 from counters import Counters
 from quicksort import quicksort_variant
 from natural_merge import list_from_array, list_to_array, natural_merge_sort_linked, Node
-from io_utils import read_ints, write_lines, generate_inputs_for_sizes, echo_block_for_large_input
+from io_utils import (read_ints, write_lines, generate_inputs_for_sizes, echo_block_for_large_input,
+                      MultisetDigest, validate_sorted_output)
+from profiling import geometric_sizes, scale_sweep, open_scale_csv, append_csv_row, write_scale_report
 
 # Lab-required sizes and orders
 SIZES = [50, 1000, 2000, 5000, 10000]
 ORDERS = ["asc", "desc", "rand"]
 
+# (output label, variant key) for the five sorts
+VARIANTS = [
+    ("qsort_first_stop12",   "first_stop12"),
+    ("qsort_first_ins100",   "first_ins100"),
+    ("qsort_first_ins50",    "first_ins50"),
+    ("qsort_median3_stop12", "median3_stop12"),
+    ("nat_merge_linked",     "natmerge")
+]
 
-def check_sorted(arr: list[int]) -> bool:
-    """
-    Verify that arr is sorted in non-decreasing order.
-    Returns True if sorted, False otherwise.
-    """
-    for i in range(1, len(arr)):
-        if arr[i - 1] > arr[i]:
-            return False
-    return True
+# Scaling sweep defaults
+SCALE_MIN_N = 1000
+SCALE_MAX_N = 10 ** 7
+SCALE_TIME_LIMIT_S = 60.0
+SCALE_TRACE_LIMIT_S = 60.0
 
 
 def lines_for_header(algorithm_label: str, input_label: str,
@@ -123,6 +137,13 @@ def run_natural_merge(arr: list[int]) -> tuple[list[int], Counters]:
     return sorted_arr, c
 
 
+def run_variant(arr: list[int], variant_key: str) -> tuple[list[int], Counters]:
+    """Run any of the five sorts (by VARIANTS key) on a copy of arr."""
+    if variant_key == "natmerge":
+        return run_natural_merge(arr)
+    return run_on_array(arr, variant_key)
+
+
 def write_output_for_small(output_dir: str, label: str, header_lines: list[str],
                            raw_input: list[int], sorted_output: list[int]) -> None:
     """
@@ -161,18 +182,11 @@ def run_all(input_dir: str, output_dir: str) -> None:
         input_dir: Directory containing the input text files.
         output_dir: Directory where output files will be saved.
     """
-    variants = [
-        ("qsort_first_stop12",   "first_stop12"),
-        ("qsort_first_ins100",   "first_ins100"),
-        ("qsort_first_ins50",    "first_ins50"),
-        ("qsort_median3_stop12", "median3_stop12"),
-        ("nat_merge_linked",     "natmerge")
-    ]
-
     for n in SIZES:
         for order in ORDERS:
             in_path = f"{input_dir}/{n}_{order}.txt"
-            raw, errs = read_ints(in_path)
+            in_digest = MultisetDigest()
+            raw, errs = read_ints(in_path, in_digest)
             label_base = f"{n}_{order}"
 
             if raw is None:
@@ -186,16 +200,20 @@ def run_all(input_dir: str, output_dir: str) -> None:
                     err_lines.append(f"line {lineno}: {msg}")
                 write_lines(f"{output_dir}/READ_ERRORS_{label_base}.txt", err_lines)
 
-            for vname, vkey in variants:
-                if vkey == "natmerge":
-                    sorted_arr, c = run_natural_merge(raw)
-                else:
-                    sorted_arr, c = run_on_array(raw, vkey)
-
-                # Verify sortedness
-                if not check_sorted(sorted_arr):
-                    write_lines(f"{output_dir}/ERROR_sort_{vname}_{label_base}.txt",
-                                [f"Sort did not produce non-decreasing output for {in_path}."])
+            for vname, vkey in VARIANTS:
+                sorted_arr, c = run_variant(raw, vkey)
+
+                # Verify sortedness and that output is a permutation of input
+                ok, sv = validate_sorted_output(sorted_arr, in_digest)
+                if not ok:
+                    problems = []
+                    if not sv.is_sorted:
+                        problems.append(f"Sort did not produce non-decreasing output for {in_path} "
+                                        f"(first descent at index {sv.first_violation}).")
+                    if not sv.digest.same_as(in_digest):
+                        problems.append(f"Sort output is not a permutation of {in_path} "
+                                        f"(input count={in_digest.count}, output count={sv.digest.count}).")
+                    write_lines(f"{output_dir}/ERROR_sort_{vname}_{label_base}.txt", problems)
 
                 # Build header
                 header = lines_for_header(vname, f"{n}_{order}.txt",
@@ -214,6 +232,44 @@ def generate_inputs(out_input_dir: str) -> None:
     generate_inputs_for_sizes(SIZES, out_input_dir)
 
 
+def run_scale(output_dir: str, max_n: int = SCALE_MAX_N,
+              time_limit_s: float = SCALE_TIME_LIMIT_S,
+              trace_limit_s: float = SCALE_TRACE_LIMIT_S) -> bool:
+    """
+    Run all five sorts over a geometric size sweep up to max_n and write
+    scale_results.csv (plot-ready) and scale_report.txt to output_dir.
+
+    Parameters:
+        output_dir: Directory where the CSV and report will be saved.
+        max_n: Largest input size in the sweep.
+        time_limit_s: Sizes whose sort is predicted to take longer than this are skipped.
+        trace_limit_s: Memory is not traced where the tracemalloc run is
+            predicted to take longer than this (the sort is still timed).
+
+    Returns:
+        True if both output files were written. The CSV is opened before the
+        sweep starts, so an unwritable output_dir fails immediately.
+    """
+    csv_file = open_scale_csv(output_dir)
+    if csv_file is None:
+        return False
+    sizes = geometric_sizes(min(SCALE_MIN_N, max_n), max_n)
+    try:
+        rows = scale_sweep(VARIANTS, run_variant, sizes, ORDERS, time_limit_s, trace_limit_s,
+                           on_row=lambda row: append_csv_row(csv_file, row))
+    finally:
+        csv_file.close()
+    return write_scale_report(output_dir, rows, VARIANTS, ORDERS)
+
+
+def print_usage() -> None:
+    """Print CLI usage for all modes."""
+    print("USAGE:")
+    print("  python drivers.py gen <out_input_dir>")
+    print("  python drivers.py run <input_dir> <output_dir>")
+    print("  python drivers.py scale <output_dir> [max_n] [time_limit_s] [trace_limit_s]")
+
+
 def main(argv: list[str]) -> None:
     """
     Main entry point for the driver.
@@ -221,11 +277,10 @@ def main(argv: list[str]) -> None:
     CLI:
         driver.py gen <out_input_dir>
         driver.py run <input_dir> <output_dir>
+        driver.py scale <output_dir> [max_n] [time_limit_s] [trace_limit_s]
     """
     if len(argv) < 2:
-        print("USAGE:")
-        print("  python drivers.py gen <out_input_dir>")
-        print("  python drivers.py run <input_dir> <output_dir>")
+        print_usage()
         return
 
     mode = argv[1]
@@ -241,11 +296,27 @@ def main(argv: list[str]) -> None:
             return
         run_all(argv[2], argv[3])
         print(f"Wrote outputs to {argv[3]}")
+    elif mode == "scale":
+        if len(argv) < 3 or len(argv) > 6:
+            print("USAGE: python drivers.py scale <output_dir> [max_n] [time_limit_s] [trace_limit_s]")
+            return
+        try:
+            max_n = int(argv[3]) if len(argv) > 3 else SCALE_MAX_N
+            time_limit_s = float(argv[4]) if len(argv) > 4 else SCALE_TIME_LIMIT_S
+            trace_limit_s = float(argv[5]) if len(argv) > 5 else SCALE_TRACE_LIMIT_S
+        except ValueError:
+            print("ERROR: max_n must be an integer and the limits numbers")
+            return
+        if max_n < 2 or time_limit_s <= 0 or trace_limit_s <= 0:
+            print("ERROR: max_n must be >= 2 and the limits > 0")
+            return
+        if run_scale(argv[2], max_n, time_limit_s, trace_limit_s):
+            print(f"Wrote scale_results.csv and scale_report.txt to {argv[2]}")
+        else:
+            print(f"WARNING: could not write scaling outputs to {argv[2]}")
     else:
         print("Unknown mode:", mode)
-        print("USAGE:")
-        print("  python drivers.py gen <out_input_dir>")
-        print("  python drivers.py run <input_dir> <output_dir>")
+        print_usage()
 
 
 if __name__ == "__main__":
@@ -8,15 +8,183 @@ Guideline compliance:
 
 Note:
   We avoid imports except standard I/O via 'sys' in driver. No 'os' used here.
+  NumPy is optional: if it is installed, large outputs are validated with
+  vectorized operations; otherwise the pure-Python path is used.
 """
 
+from typing import Optional
+
 from counters import Counters
 from rng import LCG, fisher_yates_shuffle
 
-def read_ints(path: str):
+try:
+    import numpy as np
+except ImportError:  # optional; pure-Python fallback below
+    np = None
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+_NUMPY_MIN_CHUNK = 4096  # below this, per-element Python is cheaper than array setup
+
+def _mix64(v: int) -> int:
+    """SplitMix64 finalizer: spread a 64-bit value so sums of hashes are order-free."""
+    z = (v + 0x9E3779B97F4A7C15) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+def _as_int64_array(values):
+    """values as a NumPy int64 array, or None if NumPy is missing or they do not fit."""
+    if np is None:
+        return None
+    try:
+        return np.asarray(values, dtype=np.int64)
+    except (OverflowError, TypeError, ValueError):
+        return None
+
+def _mix64_sum_numpy(a) -> int:
+    """Vectorized _mix64 over an int64 array, summed mod 2^64."""
+    z = a.view(np.uint64) + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    z ^= z >> np.uint64(31)
+    return int(z.sum(dtype=np.uint64))
+
+class MultisetDigest:
+    """
+    Order-independent fingerprint of a multiset of integers: (count, hash).
+    hash is the sum (mod 2^64) of _mix64 over every value, so any permutation
+    gives the same digest while dropped or duplicated elements change it.
+    """
+    def __init__(self):
+        self.count = 0
+        self.hash = 0
+
+    def add(self, v: int) -> None:
+        """Fold one value into the digest."""
+        self.count += 1
+        self.hash = (self.hash + _mix64(v & _MASK64)) & _MASK64
+
+    def add_many(self, values) -> None:
+        """Fold a batch of values; uses NumPy for large batches when available."""
+        if len(values) >= _NUMPY_MIN_CHUNK:
+            a = _as_int64_array(values)
+            if a is not None:
+                self.hash = (self.hash + _mix64_sum_numpy(a)) & _MASK64
+                self.count += int(a.size)
+                return
+        h = self.hash
+        for v in values:
+            h += _mix64(v & _MASK64)
+        self.hash = h & _MASK64
+        self.count += len(values)
+
+    def same_as(self, other: "MultisetDigest") -> bool:
+        """True if both digests describe the same multiset (with high probability)."""
+        return self.count == other.count and self.hash == other.hash
+
+class SortValidator:
+    """
+    Fused single-pass check of a sort result.
+
+    Feed the output values in order (all at once, in chunks, or one at a time
+    as they stream from an external merge); each value is checked against its
+    predecessor for non-decreasing order and folded into a MultisetDigest.
+    Compare the result to the digest collected by read_ints to confirm the
+    output is a permutation of the input.
+    """
+    def __init__(self):
+        self.digest = MultisetDigest()
+        self.is_sorted = True
+        self.first_violation = -1  # output index of first descent, or -1
+        self._last = None
+
+    def feed(self, v: int) -> None:
+        """Check and fold a single streamed value."""
+        d = self.digest
+        if self.is_sorted and self._last is not None and self._last > v:
+            self.is_sorted = False
+            self.first_violation = d.count
+        self._last = v
+        d.add(v)
+
+    def feed_many(self, values) -> None:
+        """Check and fold a chunk of values; uses NumPy for large chunks when available."""
+        if len(values) >= _NUMPY_MIN_CHUNK:
+            if self._feed_numpy(values):
+                return
+        self._feed_python(values)
+
+    def _feed_python(self, values) -> None:
+        """Pure-Python feed_many; the reference the NumPy path must agree with."""
+        d = self.digest
+        last = self._last
+        is_sorted = self.is_sorted
+        count = d.count
+        h = d.hash
+        for v in values:
+            if is_sorted and last is not None and last > v:
+                is_sorted = False
+                self.first_violation = count
+            last = v
+            count += 1
+            h += _mix64(v & _MASK64)
+        self._last = last
+        self.is_sorted = is_sorted
+        d.count = count
+        d.hash = h & _MASK64
+
+    def _feed_numpy(self, values) -> bool:
+        """Vectorized feed_many; returns False if NumPy is missing or values do not fit in int64."""
+        a = _as_int64_array(values)
+        if a is None:
+            return False
+        if a.size == 0:
+            return True
+        d = self.digest
+        if self.is_sorted:
+            bad = np.flatnonzero(a[:-1] > a[1:])
+            if self._last is not None and self._last > int(a[0]):
+                self.is_sorted = False
+                self.first_violation = d.count
+            elif bad.size:
+                self.is_sorted = False
+                self.first_violation = d.count + int(bad[0]) + 1
+        d.hash = (d.hash + _mix64_sum_numpy(a)) & _MASK64
+        d.count += int(a.size)
+        self._last = int(a[-1])
+        return True
+
+    def matches(self, expected: MultisetDigest) -> bool:
+        """True if output was sorted and is a permutation of the expected input."""
+        return self.is_sorted and self.digest.same_as(expected)
+
+def validate_sorted_output(values, expected: MultisetDigest, chunk_size: int = 65536):
+    """
+    Validate a sort result in one pass: order and permutation together.
+    'values' may be a list or any iterable (e.g. a generator reading merged
+    runs back from disk); iterables are consumed in chunks of chunk_size.
+    Returns (ok, validator): ok is True if the output is sorted and a
+    permutation of 'expected'; the SortValidator shows what failed.
+    """
+    sv = SortValidator()
+    if isinstance(values, list):
+        sv.feed_many(values)
+        return sv.matches(expected), sv
+    chunk = []
+    for v in values:
+        chunk.append(v)
+        if len(chunk) >= chunk_size:
+            sv.feed_many(chunk)
+            chunk = []
+    if chunk:
+        sv.feed_many(chunk)
+    return sv.matches(expected), sv
+
+def read_ints(path: str, digest: Optional[MultisetDigest] = None):
     """
     Read newline-separated integers from 'path'.
     Returns (values, errors) where errors is a list of (lineno, text).
+    If 'digest' is given, all accepted values are also folded into it.
     """
     vals = []
     errors = []
@@ -43,6 +211,8 @@ def read_ints(path: str):
         else:
             errors.append((lineno, "non-integer: " + s))
     f.close()
+    if digest is not None:
+        digest.add_many(vals)
     return vals, errors
 
 def write_lines(path: str, lines):
@@ -80,14 +250,22 @@ def generate_inputs_for_sizes(sizes, out_dir, seed_base=123456789):
     Numbers are 1..size (duplicates == 0% which is ≤ 1% requirement).
     """
     for n in sizes:
-        asc = list(range(1, n+1))
-        desc = list(range(n, 0, -1))
-        rnd = list(range(1, n+1))
-        rng = LCG(seed=seed_base + n)
-        fisher_yates_shuffle(rnd, rng)
-        _write_int_list(out_dir + f"/{n}_asc.txt", asc)
-        _write_int_list(out_dir + f"/{n}_desc.txt", desc)
-        _write_int_list(out_dir + f"/{n}_rand.txt", rnd)
+        for order in ("asc", "desc", "rand"):
+            _write_int_list(out_dir + f"/{n}_{order}.txt", make_input(n, order, seed_base))
+
+def make_input(n, order, seed_base=123456789):
+    """
+    Build one in-memory input of 1..n in the given order ('asc', 'desc', 'rand').
+    Same data as the generated files, so file and in-memory runs agree.
+    """
+    if order == "asc":
+        return list(range(1, n+1))
+    if order == "desc":
+        return list(range(n, 0, -1))
+    rnd = list(range(1, n+1))
+    rng = LCG(seed=seed_base + n)
+    fisher_yates_shuffle(rnd, rng)
+    return rnd
 
 def _write_int_list(path, nums):
     lines = [str(x) for x in nums]
@@ -0,0 +1,298 @@
+"""
+Scaling & Memory Profiling (geometric size sweep)
+
+Purpose:
+    Run each sort over sizes well beyond the lab's fixed SIZES to see how the
+    engines actually scale. For every (algorithm, order, n) we record:
+      - seconds        : wall time of the sort alone (untraced run)
+      - traced_seconds : wall time of the second, tracemalloc-traced run
+      - peak_bytes     : tracemalloc peak during the traced run
+    (the last three stay empty at sizes where tracing is over its budget)
+      - bytes_per_elem : peak_bytes / n (shows the cost of Node vs array)
+      - comparisons / exchanges from Counters
+      - valid          : fused order + permutation check from io_utils
+    Then fit the empirical exponent k in  time ~ n^k  (and comparisons ~ n^k)
+    per algorithm and order by least squares on log-log points.
+
+Budget:
+    Quadratic cases (first-element pivot on sorted input) cannot reach 10^7
+    in Python. Before each size we predict the untraced sort time from the
+    last two points; if it exceeds time_limit_s, larger sizes for that
+    (algorithm, order) are skipped and marked as such in the report.
+    tracemalloc makes a run 5-30x slower, so the traced run has its own
+    budget (trace_limit_s), predicted the same way from earlier traced runs.
+    Above it the sort is still timed, only memory is left unmeasured, so a
+    skip in the report always means the algorithm itself got too slow.
+
+Output:
+    CSV rows are appended and flushed as each run finishes, so an interrupted
+    sweep keeps everything measured so far. Opening the CSV before the sweep
+    also catches an unwritable output directory up front.
+
+Notes:
+    Uses only the standard library (sys, time, math, tracemalloc; 'resource'
+    if the platform has it for process peak RSS).
+"""
+
+import math
+import sys
+import time
+import tracemalloc
+
+from io_utils import make_input, MultisetDigest, validate_sorted_output, write_lines
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+SUPERLINEAR_WARN_K = 1.5  # exponents above this are flagged as likely quadratic
+
+
+def geometric_sizes(lo: int, hi: int, per_decade: int = 3) -> list[int]:
+    """Strictly increasing sizes from lo to hi (inclusive) spaced evenly on a log scale."""
+    sizes = []
+    i = 0
+    while True:
+        n = int(round(lo * 10 ** (i / per_decade)))
+        if n >= hi:
+            break
+        if not sizes or n > sizes[-1]:
+            sizes.append(n)
+        i += 1
+    sizes.append(hi)
+    assert all(a < b for a, b in zip(sizes, sizes[1:]))
+    return sizes
+
+
+def peak_rss_bytes():
+    """Process high-water RSS in bytes, or None if the platform cannot report it."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux/BSD
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def fit_exponent(points):
+    """
+    Least-squares slope of log(y) against log(n) for points [(n, y), ...].
+    Returns None if fewer than two usable points (y must be > 0).
+    """
+    xs = []
+    ys = []
+    for n, y in points:
+        if n > 0 and y > 0:
+            xs.append(math.log(n))
+            ys.append(math.log(y))
+    m = len(xs)
+    if m < 2:
+        return None
+    mx = sum(xs) / m
+    my = sum(ys) / m
+    sxx = sum((x - mx) ** 2 for x in xs)
+    if sxx == 0:
+        return None
+    sxy = sum((x - mx) * (y - my) for x, y in zip(xs, ys))
+    return sxy / sxx
+
+
+def _predict_seconds(done, n_next):
+    """Extrapolate the next size's cost from the last two (n, seconds) points."""
+    if not done:
+        return 0.0
+    n1, t1 = done[-1]
+    k = 1.0
+    if len(done) >= 2:
+        n0, t0 = done[-2]
+        if t0 > 0 and t1 > 0:
+            k = max(1.0, math.log(t1 / t0) / math.log(n1 / n0))
+    return t1 * (n_next / n1) ** k
+
+
+def profile_one(run_fn, arr, vkey, digest: MultisetDigest, trace: bool = True):
+    """
+    Time one sort, then (if 'trace') re-run it under tracemalloc for peak memory.
+    'digest' is the input's MultisetDigest, built once per arr by the caller.
+    Returns a dict of measurements for this (vkey, arr); memory fields are
+    None when not traced.
+    """
+    t0 = time.perf_counter()
+    sorted_arr, c = run_fn(arr, vkey)
+    seconds = time.perf_counter() - t0
+    valid, _ = validate_sorted_output(sorted_arr, digest)
+    del sorted_arr
+
+    n = len(arr)
+    row = {
+        "seconds": seconds,
+        "traced_seconds": None,
+        "peak_bytes": None,
+        "bytes_per_elem": None,
+        "comparisons": c.comparisons,
+        "exchanges": c.exchanges,
+        "valid": valid,
+    }
+    if not trace:
+        return row
+
+    tracemalloc.start()
+    try:
+        t0 = time.perf_counter()
+        traced_out, _ = run_fn(arr, vkey)
+        traced_seconds = time.perf_counter() - t0
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del traced_out
+
+    row["traced_seconds"] = traced_seconds
+    row["peak_bytes"] = peak
+    row["bytes_per_elem"] = peak / n if n else 0.0
+    return row
+
+
+def scale_sweep(variants, run_fn, sizes, orders, time_limit_s: float = 60.0,
+                trace_limit_s: float = 60.0, log=print, on_row=None) -> list[dict]:
+    """
+    Run every variant on every order over 'sizes'.
+
+    Parameters:
+        variants: [(label, key), ...] as used by the driver.
+        run_fn: callable(arr, key) -> (sorted_list, Counters).
+        sizes: strictly increasing list of n.
+        orders: input orders understood by io_utils.make_input.
+        time_limit_s: skip a size whose predicted (untraced) sort time exceeds this.
+        trace_limit_s: skip the tracemalloc run when its predicted time exceeds this.
+        log: progress callback (one line per run).
+        on_row: optional callback(row) invoked as soon as each row is final.
+
+    Returns:
+        One row dict per (variant, order, n); skipped sizes have status 'skipped'.
+    """
+    rows = []
+    for order in orders:
+        for n in sizes:
+            arr = make_input(n, order)
+            digest = MultisetDigest()
+            digest.add_many(arr)
+            for vname, vkey in variants:
+                mine = [r for r in rows if r["algorithm"] == vname and r["order"] == order]
+                ok = [r for r in mine if r["status"] == "ok"]
+                done = [(r["n"], r["seconds"]) for r in ok]
+                traced = [(r["n"], r["traced_seconds"]) for r in ok
+                          if r["traced_seconds"] is not None]
+                skipped = any(r["status"] == "skipped" for r in mine)
+                # tracing stops for good once a size goes untraced
+                trace = (not any(r["traced_seconds"] is None for r in ok)
+                         and _predict_seconds(traced, n) <= trace_limit_s)
+                row = {"algorithm": vname, "order": order, "n": n}
+                if skipped or _predict_seconds(done, n) > time_limit_s:
+                    row["status"] = "skipped"
+                else:
+                    row.update(profile_one(run_fn, arr, vkey, digest, trace))
+                    row["status"] = "ok"
+                    if trace:
+                        mem = (f"(traced {row['traced_seconds']:.3f}s) "
+                               f"{row['bytes_per_elem']:.1f} B/elem")
+                    else:
+                        mem = "(memory not traced)"
+                    log(f"{vname:<22} {order:<5} n={n:<9} {row['seconds']:.3f}s {mem}")
+                rows.append(row)
+                if on_row is not None:
+                    on_row(row)
+            del arr
+    return rows
+
+
+CSV_FIELDS = ["algorithm", "order", "n", "status", "seconds", "traced_seconds",
+              "peak_bytes", "bytes_per_elem", "comparisons", "exchanges", "valid"]
+
+
+def csv_row(row) -> str:
+    """One plot-ready CSV line for a row (empty cells for skipped runs)."""
+    cells = []
+    for f in CSV_FIELDS:
+        v = row.get(f)
+        if v is None:
+            cells.append("")
+        elif isinstance(v, float):
+            cells.append(f"{v:.6g}")
+        else:
+            cells.append(str(v))
+    return ",".join(cells)
+
+
+def open_scale_csv(output_dir: str):
+    """
+    Create scale_results.csv and write its header.
+    Returns the open file, or None if it cannot be written.
+    """
+    try:
+        f = open(f"{output_dir}/scale_results.csv", "w")
+        f.write(",".join(CSV_FIELDS) + "\n")
+        f.flush()
+        return f
+    except:
+        return None
+
+
+def append_csv_row(f, row) -> None:
+    """Append one row and flush so an interrupted sweep keeps its data."""
+    f.write(csv_row(row) + "\n")
+    f.flush()
+
+
+def report_lines(rows, variants, orders) -> list[str]:
+    """
+    Human-readable summary: fitted exponents, max size reached, memory per
+    element at the largest traced size, and warnings for superlinear growth
+    or failed validation.
+    """
+    lines = [
+        "==== DATA STRUCTURES LAB 4: SCALING REPORT ====",
+        "k_time / k_cmp: fitted exponent in  y ~ n^k  (1.0 linear, ~1.1 n log n, 2.0 quadratic)",
+        "",
+        f"{'ALGORITHM':<22} {'ORDER':<5} {'MAX_N':>9} {'k_time':>7} {'k_cmp':>7} "
+        f"{'SEC@MAX':>9} {'B/ELEM':>8}  NOTES",
+    ]
+    for vname, _ in variants:
+        for order in orders:
+            ok = [r for r in rows if r["algorithm"] == vname and r["order"] == order
+                  and r["status"] == "ok"]
+            if not ok:
+                lines.append(f"{vname:<22} {order:<5} {'-':>9}  (no completed runs)")
+                continue
+            k_t = fit_exponent([(r["n"], r["seconds"]) for r in ok])
+            k_c = fit_exponent([(r["n"], r["comparisons"]) for r in ok])
+            last = ok[-1]
+            traced = [r for r in ok if r["bytes_per_elem"] is not None]
+            notes = []
+            if k_c is not None and k_c > SUPERLINEAR_WARN_K:
+                notes.append("WARNING superlinear")
+            if any(not r["valid"] for r in ok):
+                notes.append("WARNING invalid output")
+            if any(r["algorithm"] == vname and r["order"] == order
+                   and r["status"] == "skipped" for r in rows):
+                notes.append("larger sizes skipped (time limit)")
+            if traced and traced[-1] is not last:
+                notes.append(f"memory traced up to n={traced[-1]['n']} (trace limit)")
+            elif not traced:
+                notes.append("memory not traced (trace limit)")
+            bpe_s = f"{traced[-1]['bytes_per_elem']:.1f}" if traced else "-"
+            k_t_s = f"{k_t:.2f}" if k_t is not None else "-"
+            k_c_s = f"{k_c:.2f}" if k_c is not None else "-"
+            lines.append(f"{vname:<22} {order:<5} {last['n']:>9} {k_t_s:>7} {k_c_s:>7} "
+                         f"{last['seconds']:>9.3f} {bpe_s:>8}  "
+                         + "; ".join(notes))
+    rss = peak_rss_bytes()
+    if rss is not None:
+        lines.append("")
+        lines.append(f"process peak RSS over whole sweep (MB): {rss / (1024 * 1024):.1f}")
+    lines.append("===============================================")
+    return lines
+
+
+def write_scale_report(output_dir: str, rows, variants, orders) -> bool:
+    """Write scale_report.txt; True if it succeeded."""
+    return write_lines(f"{output_dir}/scale_report.txt", report_lines(rows, variants, orders))